@@ -1,6 +1,7 @@
 # Config loader (dev/stg/prod ready)
 # Loads environment-specific YAML configs (dev/stg/prod)
 
+import functools
 import os
 from dataclasses import dataclass
 from pathlib import Path
@@ -8,7 +9,7 @@ from pathlib import Path
 import yaml
 
 
-@dataclass(frozen=True) 
+@dataclass(frozen=True, slots=True)
 # Returns typed AppConfig dataclass with AWS resource names
 # This class holds the configuration parameters for the application
 class AppConfig:
@@ -20,13 +21,16 @@ class AppConfig:
     ddb_table_daily_features: str
 
 # Reads SCP_ENV environment variable to load correct config file
+@functools.lru_cache(maxsize=1)
 def load_config() -> AppConfig:
     """
     Load application configuration from environment-specific YAML file.
     This function determines the current environment (dev/stg/prod) from the SCP_ENV
     environment variable and loads the corresponding YAML configuration file. The
     configuration includes AWS resource settings such as region, S3 buckets, prefixes,
-    and DynamoDB table names.'
+    and DynamoDB table names. The result is memoized: config is immutable for the
+    lifetime of a job, and callers on hot paths (S3/DynamoDB helpers) invoke this
+    per call, so caching avoids re-reading and re-parsing the YAML every time.
     """
     env = os.getenv("SCP_ENV", "dev").lower()
     cfg_path = Path(__file__).parent / f"{env}.yml"
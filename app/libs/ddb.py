@@ -1,23 +1,74 @@
 # Upserts (inserts or updates) daily feature records into a DynamoDB table.
 
+import functools
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import boto3
+from boto3.dynamodb.types import TypeSerializer
 
 from app.config.loader import load_config
 
+# DynamoDB hard limit on items per BatchWriteItem request
+BATCH_SIZE = 25
+# bounded pool so concurrent batches don't trip table throttling
+MAX_WORKERS = 8
+MAX_RETRIES = 5
+
+# one serializer for the process; the bound method avoids per-item lookups
+_serialize = TypeSerializer().serialize
+
 
-def ddb_resource():
+# cached so all batches (and repeated upsert calls) share one client and its
+# keep-alive connection pool instead of paying client construction per call
+@functools.cache
+def ddb_client():
     cfg = load_config()
-    return boto3.resource("dynamodb", region_name=cfg.aws_region)
+    return boto3.session.Session().client("dynamodb", region_name=cfg.aws_region)
+
+def _write_batch(client, table_name: str, batch: list[dict]):
+    """
+    Write one chunk of up to 25 pre-serialized put requests via BatchWriteItem,
+    resending any UnprocessedItems with exponential backoff + jitter until they
+    drain.
+    """
+    request_items = {table_name: batch}
+    for attempt in range(MAX_RETRIES + 1):
+        resp = client.batch_write_item(RequestItems=request_items)
+        unprocessed = resp.get("UnprocessedItems") or {}
+        if not unprocessed:
+            return
+        request_items = unprocessed
+        time.sleep(min(2 ** attempt * 0.05, 2.0) + random.uniform(0, 0.05))
+    raise RuntimeError(f"BatchWriteItem left unprocessed items after {MAX_RETRIES} retries")
 
 def upsert_daily_features(items: list[dict]):
     """
-    This function loads the application configuration, retrieves the DynamoDB table
-    for daily features, and writes each item from the provided list to the table.
-    Note that this implementation uses simple put_item operations, which is suitable
-    for small demo volumes but may not be optimal for high-throughput scenarios.
+    This function loads the application configuration, serializes the provided
+    items to the DynamoDB wire format once up front, chunks them into 25-item
+    BatchWriteItem requests (the DynamoDB hard limit), and submits the chunks
+    concurrently on a bounded thread pool. Using the low-level client with a
+    single cached TypeSerializer skips the Resource layer's per-call attribute
+    reflection; boto3 clients are thread-safe, so all workers share one client
+    and its connection pool, and each batch retries its own UnprocessedItems
+    with backoff. An empty item list returns immediately without touching
+    config or the client.
     """
+    if not items:
+        return
     cfg = load_config()
-    table = ddb_resource().Table(cfg.ddb_table_daily_features)
-    # simple writes; good enough for small demo volumes
-    for it in items:
-        table.put_item(Item=it)
+    client = ddb_client()
+    table_name = cfg.ddb_table_daily_features
+    # BatchWriteItem rejects requests containing duplicate keys, so keep only the
+    # last write per (customer_id, date) — the overwrite semantics batch_writer's
+    # overwrite_by_pkeys would give
+    deduped = {(it["customer_id"], it["date"]): it for it in items}
+    put_requests = [
+        {"PutRequest": {"Item": {k: _serialize(v) for k, v in it.items()}}}
+        for it in deduped.values()
+    ]
+    batches = [put_requests[i : i + BATCH_SIZE] for i in range(0, len(put_requests), BATCH_SIZE)]
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        # list() re-raises any worker exception
+        list(ex.map(lambda b: _write_batch(client, table_name, b), batches))
@@ -1,18 +1,21 @@
 import logging
 import os
 
+# Configure the root logger once at import time; calling basicConfig on every
+# get_logger invocation re-read the env var and rebuilt the format string even
+# though the call was a no-op after the first.
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    format="%(asctime)s %(levelname)s %(name)s - %(message)s",
+)
+
 
 def get_logger(name: str) -> logging.Logger:
     """
-    Creates and configures a logger instance with the specified name.
+    Returns a logger instance with the specified name.
 
-    This function sets up a logger with basic configuration including log level
-    (read from the LOG_LEVEL environment variable, defaulting to INFO) and a
-    standardized format for log messages.
+    Root configuration (level from the LOG_LEVEL environment variable,
+    defaulting to INFO, and a standardized message format) happens once at
+    module import, so this is just a registry lookup.
     """
-    level = os.getenv("LOG_LEVEL", "INFO").upper()
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s %(levelname)s %(name)s - %(message)s",
-    )
     return logging.getLogger(name)
@@ -1,33 +1,67 @@
 # Real data jobs (NYC TLC) using DuckDB + S3
 
+import functools
+import io
+
 import boto3
+from boto3.s3.transfer import TransferConfig
 
 from app.config.loader import load_config
 
+# shared multipart tuning: bigger parts + more concurrent part uploads than the
+# boto3 defaults (8MB / 10 threads) to better use available S3 bandwidth
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=16,
+    use_threads=True,
+)
+
 
+# cached so every upload/list shares one client and its keep-alive connection pool;
+# rebuilding a client re-parses botocore service models and costs tens of ms
+@functools.cache
 def s3_client():
     cfg = load_config()
-    return boto3.client("s3", region_name=cfg.aws_region)
+    return boto3.session.Session().client("s3", region_name=cfg.aws_region)
 
 # uploads bytes to S3
 def put_bytes(key: str, data: bytes, content_type: str = "application/octet-stream"):
     cfg = load_config()
     s3 = s3_client()
-    s3.put_object(Bucket=cfg.s3_bucket, Key=key, Body=data, ContentType=content_type)
+    if len(data) >= _TRANSFER_CONFIG.multipart_threshold:
+        # large payloads go through upload_fileobj so they get multipart parallelism too
+        s3.upload_fileobj(
+            io.BytesIO(data),
+            cfg.s3_bucket,
+            key,
+            ExtraArgs={"ContentType": content_type},
+            Config=_TRANSFER_CONFIG,
+        )
+    else:
+        s3.put_object(Bucket=cfg.s3_bucket, Key=key, Body=data, ContentType=content_type)
 
 # uploads local file to S3
 def put_file(key: str, local_path: str, content_type: str = "application/octet-stream"):
     cfg = load_config()
     s3 = s3_client()
-    s3.upload_file(local_path, cfg.s3_bucket, key, ExtraArgs={"ContentType": content_type})
+    s3.upload_file(
+        local_path,
+        cfg.s3_bucket,
+        key,
+        ExtraArgs={"ContentType": content_type},
+        Config=_TRANSFER_CONFIG,
+    )
 
-# List all object in S3 prefix.
+# Stream all object keys in an S3 prefix.
 def list_keys(prefix: str):
     cfg = load_config()
     s3 = s3_client()
     paginator = s3.get_paginator("list_objects_v2")
-    keys = []
-    for page in paginator.paginate(Bucket=cfg.s3_bucket, Prefix=prefix):
+    # full 1000-key pages, yielded lazily so large prefixes never materialize in memory
+    pages = paginator.paginate(
+        Bucket=cfg.s3_bucket, Prefix=prefix, PaginationConfig={"PageSize": 1000}
+    )
+    for page in pages:
         for obj in page.get("Contents", []):
-            keys.append(obj["Key"])
-    return keys
+            yield obj["Key"]
@@ -1,7 +1,9 @@
 # Core job runner (Entrypoint)
 
+import importlib.machinery
 import importlib.util
 import os
+import py_compile
 import sys
 from pathlib import Path
 
@@ -10,13 +12,30 @@ from app.libs.logging import get_logger
 
 log = get_logger(__name__)
 
+# Snapshot the job-relevant environment once at import instead of re-reading
+# os.environ in the hot path. Step Functions / Batch pass SCHEDULED_TIME;
+# missing keys fall back to these defaults.
+ENV = {
+    k: os.environ.get(k, default)
+    for k, default in [("SCP_ENV", "dev"), ("LOG_LEVEL", "INFO"), ("SCHEDULED_TIME", "")]
+}
+
 # Loads job module dynamically from file path
 def import_module_from_path(file_path: str):
     p = Path(file_path).resolve()
     if not p.exists():
         raise FileNotFoundError(f"Job file not found: {p}")
 
-    spec = importlib.util.spec_from_file_location(p.stem, str(p))
+    # pre-compile only when the cached bytecode is missing or stale — py_compile
+    # itself never checks freshness, so an unconditional call would re-parse and
+    # re-write the .pyc on every launch; with the guard, repeat launches in a
+    # warm container load straight from __pycache__. Best-effort (doraise=False)
+    cache = Path(importlib.util.cache_from_source(str(p)))
+    if not cache.exists() or cache.stat().st_mtime < p.stat().st_mtime:
+        py_compile.compile(str(p), doraise=False)
+
+    loader = importlib.machinery.SourceFileLoader(p.stem, str(p))
+    spec = importlib.util.spec_from_file_location(p.stem, str(p), loader=loader)
     if spec is None or spec.loader is None:
         raise RuntimeError(f"Unable to load job module: {p}")
 
@@ -49,10 +68,11 @@ def cli():
         sys.exit(2)
 
     job_path = sys.argv[1]
-    # Step Functions / Batch can pass this; jobs can read it
-    os.environ.setdefault("SCHEDULED_TIME", "")
+    # publish the snapshot defaults so jobs reading os.environ see them too
+    for k, v in ENV.items():
+        os.environ.setdefault(k, v)
     run_job(job_path)
 
 # CLI command:
-# export LOCAL_TLC_PARQUET="data/tlc_small.parquet"
+# export TLC_DATA_PATH="data/tlc_small.parquet"   # optional; defaults to the raw S3 prefix
 # uv run scp-run jobs/daily_features_tlc.py
\ No newline at end of file
@@ -0,0 +1,181 @@
+# Shared implementation for the daily feature jobs: reads a TLC parquet
+# partition, computes per-vendor daily features, writes feature parquet to S3,
+# and upserts the rows to DynamoDB. The job modules are thin wrappers that
+# parametrize the input slice (row limit), fare column, and dataset tag.
+
+import functools
+import os
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import duckdb
+
+from app.config.loader import load_config
+from app.libs.ddb import upsert_daily_features
+from app.libs.exceptions import NoWorkFound
+from app.libs.logging import get_logger
+
+log = get_logger(__name__)
+
+# cached: the scheduled date can't change within one job's lifetime, so the
+# env read and ISO parse happen at most once per process
+@functools.lru_cache(maxsize=1)
+def _scheduled_date() -> str:
+    # Step Functions passes SCHEDULED_TIME like 2026-02-04T01:23:45Z
+    st = os.getenv("SCHEDULED_TIME", "")
+    if st:
+        try:
+            return datetime.fromisoformat(st.replace("Z", "+00:00")).date().isoformat()
+        except Exception:
+            pass
+    # fallback (utcnow() is deprecated and slower than the tz-aware form)
+    return datetime.now(UTC).date().isoformat()
+
+@functools.cache
+def _get_con(with_httpfs: bool) -> duckdb.DuckDBPyConnection:
+    """
+    Lazily build the process-wide DuckDB connection. Warm Batch containers can
+    run several jobs; tearing the connection down re-installs httpfs and
+    re-resolves AWS credentials every time, so keep one configured connection
+    for the container lifetime. httpfs is set up whenever the run touches S3 —
+    for the input scan or the parquet COPY — and skipped only for fully local
+    smoke runs, which then work offline.
+    """
+    con = duckdb.connect(database=":memory:")
+
+    # Match the scan parallelism to the container vCPUs and keep parquet
+    # metadata cached across queries on the same connection
+    con.execute(f"SET threads={os.cpu_count()};")
+    con.execute("PRAGMA enable_object_cache;")
+    # bound memory explicitly instead of letting DuckDB guess from the host,
+    # and let scans/aggregations run fully parallel (output order is irrelevant)
+    con.execute("PRAGMA memory_limit='4GB';")
+    con.execute("SET preserve_insertion_order=false;")
+
+    # Install and load httpfs extension for S3 access
+    if with_httpfs:
+        con.execute("INSTALL httpfs;")
+        con.execute("LOAD httpfs;")
+        # Configure AWS credentials - DuckDB uses boto3 credentials automatically
+        con.execute(f"SET s3_region='{load_config().aws_region}';")  # Our bucket region
+        con.execute("SET s3_use_ssl=true;")
+        # Keep HTTP connections warm for parallel range-GETs and ride out S3 blips
+        con.execute("SET http_keep_alive=true;")
+        con.execute("SET http_retries=5;")
+        con.execute("SET http_timeout=60000;")
+        # Let DuckDB use AWS credential chain (IAM role, env vars, etc.)
+        con.execute("CALL load_aws_credentials();")
+    return con
+
+def _mk_item(
+    cid: str, date: str, count: int, fare: float, dist: float, tag: str | None
+) -> dict:
+    # one shared dict-literal site for the per-row build; NULL averages are
+    # already folded to 0.0 by COALESCE in the query, and Decimal(repr(x))
+    # skips the slower str() float formatting path
+    item = {
+        "customer_id": cid,
+        "date": date,
+        "trip_count_1d": int(count),
+        "avg_fare_1d": Decimal(repr(fare)),
+        "avg_distance_1d": Decimal(repr(dist)),
+    }
+    if tag:
+        item["dataset_size"] = tag
+    return item
+
+def run(limit: int | None = None, fare_col: str = "fare_amount", tag: str | None = None):
+    """
+    Execute the daily features pipeline.
+
+    limit bounds the number of input rows scanned (None scans the whole
+    partition), fare_col selects the source column for the fare average
+    (fare_amount for the full job, total_amount for the sized variants), and
+    tag stamps a dataset_size attribute on the DynamoDB items and routes the
+    parquet output under the daily/ prefix.
+    """
+    cfg = load_config()
+    date = _scheduled_date()
+    log.info("Running daily features (%s) for date=%s", tag or "full", date)
+
+    # Read TLC parquet - supports both local paths and S3 URIs; the default
+    # streams straight from our raw prefix via httpfs, no download step needed
+    # s3_prefix_raw is already raw/nyc_tlc, so only the file name is appended;
+    # this matches the TLC_DATA_PATH the Batch job definition provisions
+    data_path = os.getenv("TLC_DATA_PATH")
+    if not data_path:
+        data_path = f"s3://{cfg.s3_bucket}/{cfg.s3_prefix_raw}/tlc_small.parquet"
+
+    log.info("Reading TLC data from: %s", data_path)
+
+    write_parquet = os.getenv("WRITE_PARQUET", "1") == "1"
+    con = _get_con(data_path.startswith("s3://") or write_parquet)
+
+    # Backfills can pass several partitions at once — a comma-separated list or
+    # a glob like raw/dataset=yellow/year=*/month=*/tlc_small.parquet — and
+    # DuckDB fuses them into one parallel scan instead of one job run each.
+    paths = [p.strip() for p in data_path.split(",") if p.strip()]
+
+    # Bind the paths through the relation API rather than f-string SQL — no
+    # quoting concerns if the path ever comes from untrusted config, and DuckDB
+    # can reuse the plan. Project only the columns the aggregation needs so the
+    # parquet scan range-GETs ~3 of ~19 column chunks instead of the whole file.
+    # replace=True because the connection outlives a single run.
+    trips = con.read_parquet(paths if len(paths) > 1 else paths[0]).project(
+        f"VendorID, {fare_col}, trip_distance"
+    )
+    if limit:
+        trips = trips.limit(limit)
+    trips.create_view("trips", replace=True)
+
+    # Choose a stable “entity id” to feature-engineer.
+    # TLC has VendorID; we’ll treat it as customer_id for demo.
+    q = f"""
+    SELECT
+      CAST(VendorID AS VARCHAR) AS customer_id,
+      COUNT(*) AS trip_count_1d,
+      COALESCE(AVG({fare_col}), 0.0) AS avg_fare_1d,
+      COALESCE(AVG(trip_distance), 0.0) AS avg_distance_1d
+    FROM trips
+    WHERE VendorID IS NOT NULL
+    GROUP BY 1
+    """
+    # The GROUP BY yields one row per vendor — a handful at most — so plain
+    # tuples from fetchall are cheaper than an Arrow/pandas materialization.
+    # The parquet write below stays on the decoupled COPY path.
+    rows = con.execute(q).fetchall()
+    if not rows:
+        # run_job treats this as success; skips the S3 write and DynamoDB client build
+        raise NoWorkFound(f"no VendorID groups for date={date}")
+
+    if tag:
+        # sized variants keep their historical layout: daily/ prefix, size in the
+        # file name, and an explicit date column inside the parquet
+        size = tag.split("_")[0]
+        key = f"{cfg.s3_prefix_features}/daily/date={date}/features_{size}.parquet"
+        copy_q = f"SELECT *, '{date}' AS date FROM ({q})"
+    else:
+        key = f"{cfg.s3_prefix_features}/date={date}/features.parquet"
+        copy_q = q
+
+    # Write features straight to S3: DuckDB's parquet writer streams through
+    # httpfs multipart upload, so there is no temp file and no separate upload
+    # pass. zstd level 3 writes ~30% smaller files than snappy at similar
+    # speed, cutting S3 PUT bytes and downstream GET bandwidth. Smoke-test
+    # runs (CI / local dev) can skip the S3 round-trip with WRITE_PARQUET=0,
+    # since for the sized variants the PUT latency dominates the whole job.
+    if write_parquet:
+        dest = f"s3://{cfg.s3_bucket}/{key}"
+        con.execute(
+            f"COPY ({copy_q}) TO '{dest}' "
+            "(FORMAT 'parquet', COMPRESSION 'zstd', COMPRESSION_LEVEL 3, "
+            "ROW_GROUP_SIZE 100000)"
+        )
+        log.info("Wrote features to %s", dest)
+    else:
+        log.info("Skipping parquet write (WRITE_PARQUET=0)")
+
+    # Upsert to DynamoDB (small demo volume); tuples come back in SELECT order
+    items = [_mk_item(cid, date, count, fare, dist, tag) for cid, count, fare, dist in rows]
+    upsert_daily_features(items)
+    log.info("Upserted %d feature rows to DynamoDB table=%s", len(items), cfg.ddb_table_daily_features)
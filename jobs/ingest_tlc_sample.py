@@ -4,9 +4,8 @@
 
 import os
 import tempfile
+import urllib.request
 
-import pandas as pd
-import pyarrow as pa
 import pyarrow.parquet as pq
 
 from app.config.loader import load_config
@@ -24,24 +23,48 @@ DEFAULT_SOURCE_URL = (
 
 def main():
     """
-    Download a sample of TLC (NYC Taxi & Limousine Commission) parquet data 
-    from a source URL, reduce it to 200,000 rows, and upload it to S3 in the 
-    raw data prefix. The function creates temporary files for intermediate 
-    storage and cleans them up automatically.
+    Download a sample of TLC (NYC Taxi & Limousine Commission) parquet data
+    from a source URL, reduce it to 200,000 rows, and upload it to S3 in the
+    raw data prefix. The source file is decoded batch-by-batch with pyarrow,
+    so only the row groups needed for the sample are ever materialized instead
+    of the whole month in a pandas DataFrame. Temporary files are cleaned up
+    automatically.
     """
     cfg = load_config()
     source_url = os.getenv("TLC_SOURCE_URL", DEFAULT_SOURCE_URL)
     log.info("Ingesting TLC parquet from: %s", source_url)
 
     with tempfile.TemporaryDirectory() as td:
+        local_in = f"{td}/tlc_source.parquet"
         local_out = f"{td}/tlc_small.parquet"
 
-        # read a small slice to keep everything lightweight
-        df = pd.read_parquet(source_url)
-        df = df.head(200_000)  # keep it small for demo + cost control
+        # download once (urlretrieve streams chunk-by-chunk, constant memory),
+        # then decode only the leading batches for the sample
+        urllib.request.urlretrieve(source_url, local_in)
 
-        table = pa.Table.from_pandas(df)
-        pq.write_table(table, local_out, compression="snappy")
+        # re-encode batch-by-batch through ParquetWriter so the pipeline never
+        # holds more than one decoded batch — no Table materialization at all.
+        # zstd level 3 is ~30-40% smaller than snappy at similar decode speed;
+        # this file is uploaded, stored, and re-downloaded, so bytes are the cost
+        pf = pq.ParquetFile(local_in)
+        remaining = 200_000  # keep it small for demo + cost control
+        # 50k-row batches become 50k-row output row groups: four groups for the
+        # 200k sample, one per downstream DuckDB scan thread
+        with pq.ParquetWriter(
+            local_out,
+            pf.schema_arrow,
+            compression="zstd",
+            compression_level=3,
+            use_dictionary=True,
+            data_page_size=1 << 20,
+        ) as writer:
+            for batch in pf.iter_batches(batch_size=50_000):
+                if batch.num_rows > remaining:
+                    batch = batch.slice(0, remaining)
+                writer.write_batch(batch)
+                remaining -= batch.num_rows
+                if remaining == 0:
+                    break
 
         key = f"{cfg.s3_prefix_raw}/dataset=yellow/year=2023/month=01/tlc_small.parquet"
         put_file(key, local_out, content_type="application/octet-stream")